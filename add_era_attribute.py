@@ -10,8 +10,35 @@ Era Categories:
 
 import csv
 import re
+import sys
 from pathlib import Path
 
+# Known discontinued models (classic era)
+DISCONTINUED_MODELS = [
+    'ritz', 'zen', 'esteem', 'omni', 'gypsy', 'palio', 'indigo', 
+    'logan', 'sumo', 'safari dicor', 'venture', 'ambassador',
+    'figo aspire', 'punto', 'linea', 'aveo', 'optra', 'sail'
+]
+
+# Current generation models (known popular current models)
+CURRENT_MODELS = [
+    'nexon', 'harrier', 'safari', 'punch', 'altroz',  # Tata
+    'venue', 'creta', 'alcazar', 'tucson', 'ioniq',  # Hyundai
+    'seltos', 'sonet', 'carens', 'carnival', 'ev6',  # Kia
+    'hector', 'astor', 'zs ev', 'gloster',  # MG
+    'compass', 'meridian',  # Jeep
+    'xuv700', 'xuv300', 'scorpio-n', 'thar',  # Mahindra
+    'grand vitara', 'jimny', 'fronx',  # Maruti new models
+    'kushaq', 'slavia', 'kodiaq',  # Skoda
+    'taigun', 'virtus',  # VW
+    'hyryder',  # Toyota
+]
+
+# One compiled alternation per list: a single scan of the model name finds a
+# hit from any of the names instead of one substring test per name.
+DISCONTINUED_PATTERN = re.compile("|".join(map(re.escape, DISCONTINUED_MODELS)))
+CURRENT_PATTERN = re.compile("|".join(map(re.escape, CURRENT_MODELS)))
+
 def extract_year_from_model(model_name: str) -> int:
     """Extract year from model name if available.
     
@@ -55,15 +82,8 @@ def determine_era_by_model_knowledge(brand: str, model_name: str, year: int = No
             return 'classic'
     
     # Known discontinued models (classic era)
-    discontinued_models = [
-        'ritz', 'zen', 'esteem', 'omni', 'gypsy', 'palio', 'indigo', 
-        'logan', 'sumo', 'safari dicor', 'venture', 'ambassador',
-        'figo aspire', 'punto', 'linea', 'aveo', 'optra', 'sail'
-    ]
-    
-    for disc in discontinued_models:
-        if disc in model_lower:
-            return 'classic'
+    if DISCONTINUED_PATTERN.search(model_lower):
+        return 'classic'
     
     # BS-II, BS-III = very old (classic)
     if 'bs-ii' in model_lower or 'bs-iii' in model_lower or 'bs ii' in model_lower:
@@ -78,22 +98,8 @@ def determine_era_by_model_knowledge(brand: str, model_name: str, year: int = No
         return 'current'
     
     # Current generation models (known popular current models)
-    current_models = [
-        'nexon', 'harrier', 'safari', 'punch', 'altroz',  # Tata
-        'venue', 'creta', 'alcazar', 'tucson', 'ioniq',  # Hyundai
-        'seltos', 'sonet', 'carens', 'carnival', 'ev6',  # Kia
-        'hector', 'astor', 'zs ev', 'gloster',  # MG
-        'compass', 'meridian',  # Jeep
-        'xuv700', 'xuv300', 'scorpio-n', 'thar',  # Mahindra
-        'grand vitara', 'jimny', 'fronx',  # Maruti new models
-        'kushaq', 'slavia', 'kodiaq',  # Skoda
-        'taigun', 'virtus',  # VW
-        'hyryder',  # Toyota
-    ]
-    
-    for current in current_models:
-        if current in model_lower:
-            return 'current'
+    if CURRENT_PATTERN.search(model_lower):
+        return 'current'
     
     # If model has "2.0", "2.5", "3.0" and is luxury brand, likely recent
     if brand_lower in ['bmw', 'mercedes-benz', 'audi', 'jaguar', 'land rover', 'porsche', 'volvo']:
@@ -104,44 +110,54 @@ def determine_era_by_model_knowledge(brand: str, model_name: str, year: int = No
     return 'recent'
 
 def add_era_column(input_csv: Path, output_csv: Path):
-    """Add era column to CSV file."""
+    """Add era column to CSV file.
+
+    Report lines are collected and written in one go at the end (or when an
+    error interrupts processing) instead of one print per sampled row.
+    """
     rows_processed = 0
     era_counts = {'current': 0, 'recent': 0, 'older': 0, 'classic': 0}
+    lines = []
     
-    with open(input_csv, 'r', encoding='utf-8') as infile, \
-         open(output_csv, 'w', encoding='utf-8', newline='') as outfile:
-        
-        reader = csv.DictReader(infile)
-        fieldnames = reader.fieldnames + ['era']
-        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for row in reader:
-            brand = row['brand']
-            model = row['model']
-            
-            # Extract year from model name
-            year = extract_year_from_model(model)
+    try:
+        with open(input_csv, 'r', encoding='utf-8') as infile, \
+             open(output_csv, 'w', encoding='utf-8', newline='') as outfile:
             
-            # Determine era
-            era = determine_era_by_model_knowledge(brand, model, year)
+            reader = csv.DictReader(infile)
+            fieldnames = reader.fieldnames + ['era']
+            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
+            writer.writeheader()
             
-            # Add era to row
-            row['era'] = era
-            writer.writerow(row)
-            
-            rows_processed += 1
-            era_counts[era] += 1
-            
-            # Print some examples
-            if rows_processed <= 10 or era == 'classic':
-                print(f"{brand} {model[:40]:<40} -> {era:>8} (year: {year or 'N/A'})")
-    
-    print(f"\n✅ Processed {rows_processed} rows")
-    print(f"\nEra Distribution:")
-    for era, count in sorted(era_counts.items()):
-        percentage = (count / rows_processed) * 100
-        print(f"  {era:>8}: {count:4d} ({percentage:5.1f}%)")
+            for row in reader:
+                brand = row['brand']
+                model = row['model']
+                
+                # Extract year from model name
+                year = extract_year_from_model(model)
+                
+                # Determine era
+                era = determine_era_by_model_knowledge(brand, model, year)
+                
+                # Add era to row
+                row['era'] = era
+                writer.writerow(row)
+                
+                rows_processed += 1
+                era_counts[era] += 1
+                
+                # Print some examples
+                if rows_processed <= 10 or era == 'classic':
+                    lines.append(f"{brand} {model[:40]:<40} -> {era:>8} (year: {year or 'N/A'})")
+        
+        lines.append(f"\n✅ Processed {rows_processed} rows")
+        lines.append(f"\nEra Distribution:")
+        for era, count in sorted(era_counts.items()):
+            percentage = (count / rows_processed) * 100
+            lines.append(f"  {era:>8}: {count:4d} ({percentage:5.1f}%)")
+    finally:
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
 
 if __name__ == '__main__':
     input_file = Path('data/car_data_enriched.csv')
@@ -1,4 +1,4 @@
-from .expert_system import CarExpertSystem
+from .expert_system import CarExpertSystem, get_knowledge_base
 from .inference_engine import InferenceEngine, Question
 from .knowledge_base import KnowledgeBase
 from .ml_model import CarPriceClassifier
@@ -7,6 +7,7 @@ from .utils import SessionLogger
 
 __all__ = [
     'CarExpertSystem',
+    'get_knowledge_base',
     'InferenceEngine',
     'Question',
     'KnowledgeBase',
@@ -7,18 +7,41 @@ interactive front-ends (CLI, UI) can drive the reasoning loop.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
+import os
 import time
 
 from .inference_engine import InferenceEngine, Question
 from .knowledge_base import KnowledgeBase
 
 
+def get_knowledge_base(data_file: str = "data/car_data_enriched.csv") -> KnowledgeBase:
+    """Return a knowledge base for ``data_file`` that is loaded once and shared.
+
+    The knowledge base is read-only after loading, so every session can reuse
+    the same instance instead of re-parsing the CSV and re-running the rules.
+    The file's modification time is part of the cache key, so a regenerated
+    CSV is picked up by the next session.
+    """
+    return _load_knowledge_base(data_file, os.path.getmtime(data_file))
+
+
+@lru_cache(maxsize=1)
+def _load_knowledge_base(data_file: str, mtime: float) -> KnowledgeBase:
+    return KnowledgeBase(data_file=data_file)
+
+
 class CarExpertSystem:
     """High-level controller for car reasoning sessions."""
 
-    def __init__(self, data_file: str = "data/car_data_enriched.csv", strategy: str = "entropy") -> None:
-        self.kb = KnowledgeBase(data_file=data_file)
+    def __init__(
+        self,
+        data_file: str = "data/car_data_enriched.csv",
+        strategy: str = "entropy",
+        knowledge_base: Optional[KnowledgeBase] = None,
+    ) -> None:
+        self.kb = knowledge_base if knowledge_base is not None else get_knowledge_base(data_file)
         self.engine = InferenceEngine(self.kb, strategy=strategy)
         self.questions_asked = 0
         self.session_start_time = None
@@ -99,4 +122,4 @@ class CarExpertSystem:
         return rules
 
 
-__all__ = ["CarExpertSystem"]
+__all__ = ["CarExpertSystem", "get_knowledge_base"]
@@ -8,9 +8,10 @@ gain to mimic expert reasoning.
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 from .knowledge_base import KnowledgeBase
 
@@ -21,7 +22,7 @@ def normalize(value: Any) -> Any:
     return value
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """Container for evidence to update belief state."""
     attribute: str
@@ -30,7 +31,7 @@ class Evidence:
     weight: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AnswerOption:
     label: str
     value: Any
@@ -56,44 +57,79 @@ class InferenceRule:
 
 
 class BeliefState:
-    """Probability distribution over candidate cars."""
+    """Probability distribution over candidate cars.
+
+    Probabilities are stored in a contiguous NumPy array aligned with the
+    model order, so updates and reductions run as vectorised array operations.
+    """
 
-    def __init__(self, models: Sequence[str]) -> None:
+    def __init__(self, models: Sequence[str], index: Optional[Mapping[str, int]] = None) -> None:
         self._models = list(models)
+        # When the knowledge base's own model index is passed in, evidence can
+        # use its precomputed match positions instead of model-name lookups.
+        self._index: Mapping[str, int] = (
+            index if index is not None else {model: position for position, model in enumerate(self._models)}
+        )
+        self._probabilities: np.ndarray = self._uniform()
+        self.revision = 0
+
+    def _uniform(self) -> np.ndarray:
         base = 1.0 / len(self._models) if self._models else 0.0
-        self._probabilities: Dict[str, float] = {model: base for model in self._models}
+        return np.full(len(self._models), base, dtype=np.float64)
+
+    def _positions(self, models: Iterable[str]) -> np.ndarray:
+        index = self._index
+        return np.fromiter(
+            (index[model] for model in set(models) if model in index),
+            dtype=np.intp,
+        )
 
     def copy(self) -> "BeliefState":
-        clone = BeliefState(self._models)
+        clone = BeliefState.__new__(BeliefState)
+        clone._models = self._models
+        clone._index = self._index
         clone._probabilities = self._probabilities.copy()
+        clone.revision = 0
         return clone
 
     def normalize(self) -> None:
-        total = sum(self._probabilities.values())
+        self.revision += 1
+        # Summed in model order like the old dict loop; ndarray.sum rounds
+        # differently and breaks exact ties between cars.
+        total = sum(self._probabilities.tolist())
         if total <= 0:
-            base = 1.0 / len(self._models) if self._models else 0.0
-            self._probabilities = {model: base for model in self._models}
+            self._probabilities = self._uniform()
             return
-        for model in self._probabilities:
-            self._probabilities[model] /= total
+        self._probabilities /= total
 
     def entropy(self) -> float:
-        entropy = 0.0
-        for probability in self._probabilities.values():
-            if probability > 0:
-                entropy -= probability * math.log2(probability)
-        return entropy
+        positive = self._probabilities[self._probabilities > 0]
+        return float(-np.sum(positive * np.log2(positive)))
 
     def gini_impurity(self) -> float:
         """Calculates the Gini impurity of the belief state."""
-        impurity = 1.0
-        for probability in self._probabilities.values():
-            impurity -= probability**2
-        return impurity
+        return 1.0 - float(np.dot(self._probabilities, self._probabilities))
 
     def ranked(self, top_n: Optional[int] = None) -> List[Tuple[str, float]]:
-        pairs = sorted(self._probabilities.items(), key=lambda item: item[1], reverse=True)
-        return pairs if top_n is None else pairs[:top_n]
+        probabilities = self._probabilities
+        if top_n is not None and 0 < top_n < len(probabilities):
+            order = self._top_positions(top_n)
+        else:
+            order = np.argsort(-probabilities, kind="stable")[:top_n]
+        return [(self._models[i], float(probabilities[i])) for i in order]
+
+    def _top_positions(self, top_n: int) -> np.ndarray:
+        """Positions of the ``top_n`` most probable models, best first.
+
+        Uses a linear-time partition instead of sorting every model; ties at
+        the cut-off keep model order, exactly as a stable full sort would.
+        """
+        probabilities = self._probabilities
+        threshold = np.partition(probabilities, len(probabilities) - top_n)[len(probabilities) - top_n]
+        above = np.flatnonzero(probabilities > threshold)
+        tied = np.flatnonzero(probabilities == threshold)[: top_n - len(above)]
+        selected = np.concatenate((above, tied))
+        return selected[np.argsort(-probabilities[selected], kind="stable")]
 
     def best(self) -> Tuple[Optional[str], float]:
         ranked = self.ranked(1)
@@ -108,8 +144,69 @@ class BeliefState:
         return ranked[0][1] - ranked[1][1]
 
     def probability_of_models(self, models: Iterable[str]) -> float:
-        lookup = set(models)
-        return sum(self._probabilities.get(model, 0.0) for model in lookup)
+        return float(self._probabilities[self._positions(models)].sum())
+
+    def _match_positions(self, knowledge_base: KnowledgeBase, attribute: str, value: Any) -> np.ndarray:
+        if self._index is knowledge_base.model_index:
+            return knowledge_base.positions_matching(attribute, value)
+        return self._positions(knowledge_base.get_models_matching(attribute, value))
+
+    def scale_models(self, models: Iterable[str], factor: float) -> None:
+        """Multiply the probability of the given models by ``factor``."""
+        self._probabilities[self._positions(models)] *= factor
+        self.revision += 1
+
+    def match_outcomes(
+        self,
+        matches: Sequence[np.ndarray],
+        confidence: float,
+        weight: float = 1.0,
+    ) -> List[Tuple[float, float, float]]:
+        """Predict the effect of each candidate answer without copying the state.
+
+        ``matches`` holds, per option, the positions of matching models in this
+        state's model order. For every option returns ``(probability, entropy,
+        gini)``: the current probability mass of the matching models, and the
+        entropy and Gini impurity the state would have after ``apply_evidence``
+        with that option. Both measures are derived from the same per-option
+        sums of ``p``, ``p * log2(p)`` and ``p ** 2``, so each option costs one
+        gather over its matching models instead of a full copy and
+        re-normalisation.
+
+        Time Complexity: O(n + m) where m is the total number of matches
+        """
+        probabilities = self._probabilities
+        positive = probabilities > 0
+        plogp = np.zeros_like(probabilities)
+        plogp[positive] = probabilities[positive] * np.log2(probabilities[positive])
+        squares = probabilities * probabilities
+        total = float(probabilities.sum())
+        total_plogp = float(plogp.sum())
+        total_squares = float(squares.sum())
+        size = len(self._models)
+
+        boost, penalty = self._match_factors(confidence, weight)
+        outcomes: List[Tuple[float, float, float]] = []
+        for positions in matches:
+            if confidence <= 0 or not positions.size:
+                # Uniform damping leaves the normalised distribution unchanged.
+                outcomes.append((0.0, self.entropy(), self.gini_impurity()))
+                continue
+            matched = float(probabilities[positions].sum())
+            matched_plogp = float(plogp[positions].sum())
+            matched_squares = float(squares[positions].sum())
+            rest = total - matched
+            norm = boost * matched + penalty * rest
+            if norm <= 0:
+                outcomes.append((matched, float(np.log2(size)), 1.0 - 1.0 / size))
+                continue
+            entropy = float(np.log2(norm)) - (
+                boost * (matched_plogp + matched * float(np.log2(boost)))
+                + penalty * ((total_plogp - matched_plogp) + rest * float(np.log2(penalty)))
+            ) / norm
+            gini = 1.0 - (boost * boost * matched_squares + penalty * penalty * (total_squares - matched_squares)) / (norm * norm)
+            outcomes.append((matched, entropy, gini))
+        return outcomes
 
     def apply_evidence(self, knowledge_base: KnowledgeBase, evidence: Evidence) -> None:
         """Apply evidence to update belief probabilities.
@@ -120,9 +217,9 @@ class BeliefState:
         if not self._is_valid_evidence(evidence.value, evidence.confidence):
             return
         
-        matches = knowledge_base.get_models_matching(evidence.attribute, evidence.value)
+        matches = self._match_positions(knowledge_base, evidence.attribute, evidence.value)
         
-        if not matches:
+        if not matches.size:
             self._apply_no_match_penalty(evidence.confidence, evidence.weight)
         else:
             self._apply_match_update(matches, evidence.confidence, evidence.weight)
@@ -136,20 +233,25 @@ class BeliefState:
     def _apply_no_match_penalty(self, confidence: float, weight: float) -> None:
         """Apply penalty when no models match the evidence."""
         damping = max(0.2, 1.0 - confidence * weight * 0.4)
-        for model in self._probabilities:
-            self._probabilities[model] *= damping
+        self._probabilities *= damping
     
-    def _apply_match_update(self, matches: set, confidence: float, weight: float) -> None:
+    def _apply_match_update(self, matches: np.ndarray, confidence: float, weight: float) -> None:
         """Update probabilities based on matching models.
         
         More aggressive updates for better discrimination.
         """
+        match_boost, mismatch_penalty = self._match_factors(confidence, weight)
+        
+        multipliers = np.full(len(self._models), mismatch_penalty)
+        multipliers[matches] = match_boost
+        self._probabilities *= multipliers
+
+    @staticmethod
+    def _match_factors(confidence: float, weight: float) -> Tuple[float, float]:
+        """Multipliers applied to matching and non-matching models."""
         match_boost = 1.0 + confidence * weight * 2.5  # Increased from 0.9
         mismatch_penalty = max(0.01, 1.0 - confidence * weight * 1.5)  # Increased penalty from 0.6
-        
-        for model in self._probabilities:
-            multiplier = match_boost if model in matches else mismatch_penalty
-            self._probabilities[model] *= multiplier
+        return match_boost, mismatch_penalty
 
     def simulate_evidence(self, knowledge_base: KnowledgeBase, evidence: Evidence) -> "BeliefState":
         """Simulate applying evidence without modifying current state.
@@ -168,15 +270,24 @@ class InferenceEngine:
     def __init__(self, knowledge_base: KnowledgeBase, strategy: str = "entropy") -> None:
         self.kb = knowledge_base
         self.strategy = strategy  # "entropy" or "gini"
-        self.belief_state = BeliefState(self.kb.models)
+        self.belief_state = BeliefState(self.kb.models, self.kb.model_index)
         self.question_bank: List[Question] = self._build_question_bank()
         self._question_lookup: Dict[str, Question] = {q.id: q for q in self.question_bank}
+        self._large_family_questions: Set[str] = {
+            q.id for q in self.question_bank if self._would_ask_large_family(q)
+        }
         self._asked: Set[str] = set()
         self._known_facts: Dict[str, Set[Any]] = {}
         self._fact_strength: Dict[str, float] = {}
         self._derived_facts: Dict[str, Set[Any]] = {}
         self._applied_evidence: Set[Tuple[str, Any]] = set()
         self._user_rules = self._user_ruleset()
+        self._metrics_state: Optional[BeliefState] = None
+        self._metrics_revision = -1
+        self._metrics_cache: Dict[str, Tuple[float, float]] = {}
+        self._option_matches = self._bind_option_matches()
+        self._differentiator_attributes = self._candidate_attributes()
+        self._differentiator_codes = self.kb.code_matrix(self._differentiator_attributes)
         self.confidence_threshold = 0.25  # Much lower - guess with top candidate at 25%
         self.gap_threshold = 0.08  # Lower gap needed
         self.max_questions = 6  # Maximum questions before forcing a guess
@@ -185,7 +296,7 @@ class InferenceEngine:
     # Public control surface
     # ------------------------------------------------------------------
     def reset(self) -> None:
-        self.belief_state = BeliefState(self.kb.models)
+        self.belief_state = BeliefState(self.kb.models, self.kb.model_index)
         self._asked.clear()
         self._known_facts.clear()
         self._derived_facts.clear()
@@ -212,28 +323,22 @@ class InferenceEngine:
 
 
     def _select_question_by_entropy(self, candidates: List[Question]) -> Optional[Question]:
-        best_question = None
-        best_gain = -1.0
-        current_entropy = self.belief_state.entropy()
-
-        for question in candidates:
-            gain = self._information_gain(question, current_entropy)
-            if gain > best_gain:
-                best_gain = gain
-                best_question = question
-        return best_question
+        return self._best_scoring_question(candidates, self._information_gain)
 
     def _select_question_by_gini(self, candidates: List[Question]) -> Optional[Question]:
-        best_question = None
-        best_reduction = -1.0
-        current_gini = self.belief_state.gini_impurity()
+        return self._best_scoring_question(candidates, self._gini_reduction)
 
-        for question in candidates:
-            reduction = self._gini_reduction(question, current_gini)
-            if reduction > best_reduction:
-                best_reduction = reduction
-                best_question = question
-        return best_question
+    def _best_scoring_question(
+        self,
+        candidates: List[Question],
+        score: Callable[[Question], float],
+    ) -> Optional[Question]:
+        """Return the highest-scoring candidate; ties go to the earliest one."""
+        if not candidates:
+            return None
+        scores = np.fromiter((score(question) for question in candidates), dtype=np.float64, count=len(candidates))
+        best = int(np.argmax(scores))
+        return candidates[best] if scores[best] > -1.0 else None
 
     def record_answer(self, question_id: str, value: Any, confidence: float) -> None:
         if question_id not in self._question_lookup:
@@ -264,10 +369,8 @@ class InferenceEngine:
         # Penalize classic era cars significantly
         classic_cars = self.kb.get_models_matching('era', 'classic')
         
-        for model in classic_cars:
-            if model in self.belief_state._probabilities:
-                # Reduce probability of classic cars by 90%
-                self.belief_state._probabilities[model] *= 0.1
+        # Reduce probability of classic cars by 90%
+        self.belief_state.scale_models(classic_cars, 0.1)
         
         self.belief_state.normalize()
 
@@ -333,7 +436,7 @@ class InferenceEngine:
             
             # Skip seating capacity questions if body type is known and incompatible
             if question.attribute == 'family_size':
-                if body_type == 'hatchback' and self._would_ask_large_family(question):
+                if body_type == 'hatchback' and question.id in self._large_family_questions:
                     continue
             
             filtered.append(question)
@@ -493,78 +596,79 @@ class InferenceEngine:
     def _find_differentiating_attributes(self, ranked: Sequence[Tuple[str, float]]) -> List[str]:
         """Find attributes that differentiate the best model from competitors.
         
+        Compares the interned value codes of the ranked models in one
+        vectorised pass: an attribute differentiates when the best model has a
+        value and no competitor shares it.
         Time Complexity: O(a * c) where a is attributes, c is competitors
         """
-        best_model = ranked[0][0]
-        competitors = [model for model, _ in ranked[1:]]
-        best_frame = self.kb.get_frame(best_model)
-        attributes = self._candidate_attributes()
-        
-        differentiators: List[str] = []
-        for attr in attributes:
-            if self._is_differentiating_attribute(attr, best_frame, competitors):
-                differentiators.append(attr)
-        return differentiators
-    
-    def _is_differentiating_attribute(self, attr: str, best_frame: Any, competitors: List[str]) -> bool:
-        """Check if an attribute differentiates the best model from all competitors."""
-        best_value = best_frame.get(attr)
-        if best_value is None:
-            return False
-        
-        for competitor in competitors:
-            comp_frame = self.kb.get_frame(competitor)
-            if normalize(comp_frame.get(attr)) == normalize(best_value):
-                return False
-        return True
+        positions = [self.kb.model_index[model] for model, _ in ranked]
+        rows = self._differentiator_codes[positions]
+        best = rows[0]
+        differs = (best >= 0) & (rows[1:] != best).all(axis=0)
+        return [self._differentiator_attributes[i] for i in np.flatnonzero(differs)]
 
-    def _gini_reduction(self, question: Question, current_gini: float) -> float:
+    def _gini_reduction(self, question: Question) -> float:
         """Calculates the reduction in impurity for a given question."""
-        total_prob = sum(self.belief_state.probability_of_models(self.kb.get_models_matching(question.attribute, opt.value)) for opt in question.options if opt.value is not None)
+        return self._question_metrics(question)[1]
+
+    def _information_gain(self, question: Question) -> float:
+        return self._question_metrics(question)[0]
+
+    def _question_metrics(self, question: Question) -> Tuple[float, float]:
+        """Return ``(information_gain, gini_reduction)`` for a question.
         
-        if total_prob == 0:
-            return 0
+        Both metrics come from the same per-option pass over the belief state
+        and are cached until the belief state changes.
+        """
+        state = self.belief_state
+        if self._metrics_state is not state or self._metrics_revision != state.revision:
+            self._metrics_state = state
+            self._metrics_revision = state.revision
+            self._metrics_cache = {}
+        metrics = self._metrics_cache.get(question.id)
+        if metrics is None:
+            metrics = self._compute_question_metrics(question)
+            self._metrics_cache[question.id] = metrics
+        return metrics
+
+    def _bind_option_matches(self) -> Dict[str, List[np.ndarray]]:
+        """Resolve every answer option to its matching model positions once.
+        
+        The question bank and knowledge base are fixed for the engine's
+        lifetime, so scoring a question never has to translate option values
+        back into index lookups.
+        """
+        return {
+            question.id: [
+                self.kb.positions_matching(question.attribute, option.value)
+                for option in question.options
+                if option.value is not None
+            ]
+            for question in self.question_bank
+        }
 
+    def _compute_question_metrics(self, question: Question) -> Tuple[float, float]:
+        outcomes = self.belief_state.match_outcomes(
+            self._option_matches[question.id],
+            confidence=0.8,
+            weight=question.weight,
+        )
+        
+        expected_entropy = 0.0
+        for probability, entropy, _ in outcomes:
+            if probability > 0:
+                expected_entropy += probability * entropy
+        gain = self.belief_state.entropy() - expected_entropy
+        
+        total_prob = sum(probability for probability, _, _ in outcomes)
+        if total_prob == 0:
+            return gain, 0.0
         weighted_gini = 0.0
-        for option in question.options:
-            if option.value is None:
-                continue
-            
-            matching_models = self.kb.get_models_matching(question.attribute, option.value)
-            prob_of_option = self.belief_state.probability_of_models(matching_models) / total_prob
-
+        for probability, _, gini in outcomes:
+            prob_of_option = probability / total_prob
             if prob_of_option > 0:
-                evidence = Evidence(
-                    attribute=question.attribute,
-                    value=option.value,
-                    confidence=0.8,
-                    weight=question.weight
-                )
-                simulated_state = self.belief_state.simulate_evidence(self.kb, evidence)
-                weighted_gini += prob_of_option * simulated_state.gini_impurity()
-        
-        return current_gini - weighted_gini
-
-    def _information_gain(self, question: Question, current_entropy: float) -> float:
-        expected_entropy = 0.0
-        for option in question.options:
-            if option.value is None:
-                continue
-            matching = self.kb.get_models_matching(question.attribute, option.value)
-            probability = self.belief_state.probability_of_models(matching)
-            if probability <= 0:
-                continue
-            evidence = Evidence(
-                attribute=question.attribute,
-                value=option.value,
-                confidence=0.8,
-                weight=question.weight
-            )
-            simulated = self.belief_state.simulate_evidence(self.kb, evidence)
-            option_entropy = simulated.entropy()
-            expected_entropy += probability * option_entropy
-        gain = current_entropy - expected_entropy
-        return gain
+                weighted_gini += prob_of_option * gini
+        return gain, self.belief_state.gini_impurity() - weighted_gini
 
     def _build_question_bank(self) -> List[Question]:
         """Build question bank with proper priorities for Akinator-style guessing.
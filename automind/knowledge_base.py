@@ -13,6 +13,8 @@ import csv
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Set, Tuple
 
+import numpy as np
+
 
 ConditionValue = Any
 ConclusionValue = Any
@@ -51,6 +53,10 @@ class CarFrame:
         return dict(self.slots)
 
 
+_NO_POSITIONS = np.empty(0, dtype=np.intp)
+_NO_POSITIONS.flags.writeable = False
+
+
 def normalise(value: Any) -> Any:
     """Normalise values for consistent comparisons."""
     if isinstance(value, str):
@@ -58,6 +64,23 @@ def normalise(value: Any) -> Any:
     return value
 
 
+# (slot key, predicate or None, normalised expected value or set of values, is_set)
+ConditionChecks = Tuple[Tuple[str, Optional[Callable[[Any], bool]], Any, bool], ...]
+
+
+def _compile_conditions(conditions: ConditionMap) -> ConditionChecks:
+    """Lower-case keys and normalise expected values once per rule."""
+    checks = []
+    for key, expected in conditions.items():
+        if callable(expected):
+            checks.append((key.lower(), expected, None, False))
+        elif isinstance(expected, (set, tuple, list)):
+            checks.append((key.lower(), None, frozenset(normalise(v) for v in expected), True))
+        else:
+            checks.append((key.lower(), None, normalise(expected), False))
+    return tuple(checks)
+
+
 class KnowledgeBase:
     """Loads cars, applies rules, and provides indexed access to facts."""
 
@@ -79,13 +102,51 @@ class KnowledgeBase:
         "drive_context",
     ]
 
+    # Display labels for derived values, built once rather than per indexed slot.
+    VALUE_LABELS: Dict[str, Dict[str, str]] = {
+        "price_segment": {
+            "budget": "Budget",
+            "value": "Value seeker",
+            "upper": "Upper mid-range",
+            "premium": "Premium",
+        },
+        "engine_band": {
+            "light": "Light (<= 1.2L)",
+            "balanced": "Balanced (1.2L-1.6L)",
+            "performance": "Performance (>= 1.6L)",
+        },
+        "persona": {
+            "eco": "Eco conscious",
+            "status": "Status driven",
+            "saver": "Value focused",
+            "family": "Family centric",
+        },
+        "usage_profile": {
+            "city": "City commuter",
+            "family": "Family cruiser",
+            "adventure": "Adventure tourer",
+        },
+        "family_size": {
+            "small": "Best for couples",
+            "medium": "Small family",
+            "large": "Large family",
+        },
+    }
+
     def __init__(self, data_file: str = "data/car_data_enriched.csv", rules: Optional[Sequence[Rule]] = None) -> None:
         self.data_file = data_file
         self._rules: List[Rule] = list(rules) if rules else self._default_rules()
+        self._rule_checks: List[Tuple[Rule, ConditionChecks]] = [
+            (rule, _compile_conditions(rule.conditions)) for rule in self._rules
+        ]
         self.frames: Dict[str, CarFrame] = {}
         self.attribute_index: Dict[str, Dict[Any, Set[str]]] = {}
         self._attribute_labels: Dict[str, Dict[Any, str]] = {}
+        self.model_index: Dict[str, int] = {}
+        self.attribute_codes: Dict[str, np.ndarray] = {}
+        self._value_positions: Dict[str, Dict[Any, np.ndarray]] = {}
         self._load()
+        self._encode()
 
     # ------------------------------------------------------------------
     # Public API
@@ -112,15 +173,30 @@ class KnowledgeBase:
         return str(value)
 
     def get_models_matching(self, attribute: str, value: Any) -> Set[str]:
-        attr = attribute.lower()
-        value_key = normalise(value)
-        matches = set()
-        if attr not in self.attribute_index:
-            return matches
-        for key, models in self.attribute_index[attr].items():
-            if normalise(key) == value_key:
-                matches.update(models)
-        return matches
+        # Index keys are stored normalised, so a direct hash lookup replaces
+        # the linear scan over every known value of the attribute.
+        values = self.attribute_index.get(attribute.lower())
+        if not values:
+            return set()
+        return set(values.get(normalise(value), ()))
+
+    def positions_matching(self, attribute: str, value: Any) -> np.ndarray:
+        """Return the positions (in ``models`` order) of models matching a value.
+
+        The returned array is shared and read-only.
+        """
+        values = self._value_positions.get(attribute.lower())
+        if not values:
+            return _NO_POSITIONS
+        return values.get(normalise(value), _NO_POSITIONS)
+
+    def code_matrix(self, attributes: Sequence[str]) -> np.ndarray:
+        """Stack ``attribute_codes`` into an (n_models, n_attributes) matrix."""
+        missing = np.full(len(self.frames), -1, dtype=np.int32)
+        columns = [self.attribute_codes.get(attribute.lower(), missing) for attribute in attributes]
+        if not columns:
+            return np.empty((len(self.frames), 0), dtype=np.int32)
+        return np.column_stack(columns)
 
     def attributes(self) -> List[str]:
         known = set(self.CORE_ATTRIBUTES) | set(self.DERIVED_ATTRIBUTES)
@@ -141,6 +217,29 @@ class KnowledgeBase:
                 self.frames[frame.model] = frame
                 self._index_frame(frame)
 
+    def _encode(self) -> None:
+        """Intern indexed values as small integer codes.
+
+        ``attribute_codes[attr]`` holds one code per model (-1 when the slot is
+        missing or None) and each value keeps a sorted array of matching model
+        positions, so hot paths work on integer arrays instead of strings.
+        """
+        self.model_index = {model: position for position, model in enumerate(self.frames)}
+        for attr, values in self.attribute_index.items():
+            codes: Dict[Any, int] = {}
+            positions: Dict[Any, np.ndarray] = {}
+            column = np.full(len(self.frames), -1, dtype=np.int32)
+            for key, models in values.items():
+                matched = np.array(sorted(self.model_index[model] for model in models), dtype=np.intp)
+                matched.flags.writeable = False
+                code = -1 if key is None else len(codes)
+                codes[key] = code
+                positions[key] = matched
+                column[matched] = code
+            column.flags.writeable = False
+            self._value_positions[attr] = positions
+            self.attribute_codes[attr] = column
+
     def _build_frame(self, row: MutableMapping[str, str]) -> CarFrame:
         model = row["model"].strip()
         brand_label = row["brand"].strip()
@@ -185,35 +284,35 @@ class KnowledgeBase:
     # ------------------------------------------------------------------
     def _run_forward_chaining(self, base_slots: Dict[str, Any]) -> Dict[str, Any]:
         derived: Dict[str, Any] = {}
+        # Flattened view of base + derived slots, kept in sync as facts are
+        # derived so each condition check is a single dict lookup.
+        facts: Dict[str, Any] = dict(base_slots)
         updated = True
         while updated:
             updated = False
-            for rule in self._rules:
-                if self._conditions_met(rule.conditions, base_slots, derived):
+            for rule, checks in self._rule_checks:
+                if self._conditions_met(checks, facts):
                     for target, result in rule.conclusion.items():
                         target_key = target.lower()
                         if target_key in derived:
                             continue
                         value = result(base_slots, derived) if callable(result) else result
                         derived[target_key] = value
+                        facts[target_key] = value
                         updated = True
         return derived
 
-    def _conditions_met(self, conditions: ConditionMap, base: Mapping[str, Any], derived: Mapping[str, Any]) -> bool:
-        snapshot = {**base, **derived}
-        for key, expected in conditions.items():
-            key_norm = key.lower()
-            value = snapshot.get(key_norm)
-            if callable(expected):
-                if not expected(value):
+    def _conditions_met(self, checks: ConditionChecks, facts: Mapping[str, Any]) -> bool:
+        for key, predicate, expected, is_set in checks:
+            value = facts.get(key)
+            if predicate is not None:
+                if not predicate(value):
                     return False
-            else:
-                if isinstance(expected, (set, tuple, list)):
-                    if normalise(value) not in {normalise(v) for v in expected}:
-                        return False
-                else:
-                    if normalise(value) != normalise(expected):
-                        return False
+            elif is_set:
+                if normalise(value) not in expected:
+                    return False
+            elif normalise(value) != expected:
+                return False
         return True
 
     # ------------------------------------------------------------------
@@ -223,44 +322,15 @@ class KnowledgeBase:
         attr = attribute.lower()
         if attr == "price_range":
             return value.replace("_", " ").replace("l", " lakhs").title()
-        if attr == "price_segment":
-            return {
-                "budget": "Budget",
-                "value": "Value seeker",
-                "upper": "Upper mid-range",
-                "premium": "Premium",
-            }.get(normalise(value), str(value).title())
-        if attr == "engine_band":
-            return {
-                "light": "Light (<= 1.2L)",
-                "balanced": "Balanced (1.2L-1.6L)",
-                "performance": "Performance (>= 1.6L)",
-            }.get(normalise(value), str(value).title())
+        labels = self.VALUE_LABELS.get(attr)
+        if labels is not None:
+            return labels.get(normalise(value), str(value).title())
         if attr == "luxury":
             return "Luxury" if bool(value) else "Mass market"
         if attr == "fuel_type":
             return str(value).title()
         if attr == "body_type":
             return str(value).upper()
-        if attr == "persona":
-            return {
-                "eco": "Eco conscious",
-                "status": "Status driven",
-                "saver": "Value focused",
-                "family": "Family centric",
-            }.get(normalise(value), str(value).title())
-        if attr == "usage_profile":
-            return {
-                "city": "City commuter",
-                "family": "Family cruiser",
-                "adventure": "Adventure tourer",
-            }.get(normalise(value), str(value).title())
-        if attr == "family_size":
-            return {
-                "small": "Best for couples",
-                "medium": "Small family",
-                "large": "Large family",
-            }.get(normalise(value), str(value).title())
         if isinstance(value, str):
             return value.title()
         return str(value)
@@ -8,16 +8,60 @@ by the inference engine, demonstrating a hybrid AI/ML approach.
 
 from __future__ import annotations
 
+from collections.abc import Hashable
+from functools import lru_cache
+from typing import List
+
+import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import HistGradientBoostingClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
 import joblib
 import os
 
+
+@lru_cache(maxsize=1)
+def _read_data(path: str, mtime: float) -> pd.DataFrame:
+    """Parse the training CSV once per file version.
+
+    The modification time is part of the cache key, so editing the file
+    forces a fresh read on the next call.
+    """
+    return pd.read_csv(path)
+
+
+@lru_cache(maxsize=8)
+def _split_indices(n_samples: int, test_size: float, random_state: int, mtime: float) -> tuple:
+    """Row positions of the train/test split, reused while the data is unchanged."""
+    train_idx, test_idx = train_test_split(
+        np.arange(n_samples), test_size=test_size, random_state=random_state
+    )
+    train_idx.setflags(write=False)
+    test_idx.setflags(write=False)
+    return train_idx, test_idx
+
+
+def _parse_flag(value):
+    """Read bool-like strings ('True', 'yes', '0', ...) as booleans.
+
+    Uses the same spellings the knowledge base accepts for the luxury column;
+    anything else is returned unchanged.
+    """
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in {"true", "yes", "1"}:
+            return True
+        if text in {"false", "no", "0"}:
+            return False
+    return value
+
+
 class CarPriceClassifier:
     """A classifier to predict the price segment of a car."""
 
+    FEATURES = ['body_type', 'fuel_type', 'luxury', 'engine_cc']
+
     def __init__(self, data_path="data/car_data_enriched.csv", model_path="ml_model.joblib"):
         self.data_path = data_path
         self.model_path = model_path
@@ -27,16 +71,23 @@ class CarPriceClassifier:
     def train(self):
         """Trains the model and saves it to disk.
         
-        Time Complexity: O(n * log(n) * m) for Random Forest training
-        where n is samples, m is features
+        Time Complexity: O(i * n * m) for histogram gradient boosting
+        where i is boosting iterations, n is samples, m is features
         """
+        # Drop any memory-mapped model first; on Windows a live mapping stops
+        # the dump from overwriting model_path.
+        self.model, self.encoders = None, {}
         df = self._load_and_prepare_data()
         X, y = self._extract_features_and_target(df)
         self._train_and_save_model(X, y)
     
     def _load_and_prepare_data(self) -> pd.DataFrame:
-        """Load data and derive price_segment if missing."""
-        df = pd.read_csv(self.data_path)
+        """Load data and derive price_segment if missing.
+
+        The parsed CSV is cached; a copy is returned because feature encoding
+        overwrites columns in place.
+        """
+        df = _read_data(self.data_path, os.path.getmtime(self.data_path)).copy()
         
         if 'price_segment' not in df.columns:
             df['price_segment'] = df['price_range'].apply(self._map_price_to_segment)
@@ -55,7 +106,7 @@ class CarPriceClassifier:
     
     def _extract_features_and_target(self, df: pd.DataFrame) -> tuple:
         """Extract and encode features and target variable."""
-        features = ['body_type', 'fuel_type', 'luxury', 'engine_cc']
+        features = self.FEATURES
         target = 'price_segment'
         
         # Encode categorical features
@@ -68,36 +119,92 @@ class CarPriceClassifier:
         return df[features], df[target]
     
     def _train_and_save_model(self, X: pd.DataFrame, y: pd.Series):
-        """Train the Random Forest model and save to disk."""
-        X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42)
+        """Train the gradient boosting model and save to disk.
+        
+        Early stopping ends boosting once the held-out loss stops improving
+        (about 30 of the 200 allowed iterations on the enriched data). With
+        four classes each iteration adds four trees, so running all 200 would
+        be slower than the random forest this replaced; stopped early, it fits
+        and predicts faster with similar accuracy.
+        """
+        train_idx, _ = _split_indices(len(X), 0.2, 42, os.path.getmtime(self.data_path))
+        X_train, y_train = X.iloc[train_idx], y.iloc[train_idx]
         
-        self.model = RandomForestClassifier(n_estimators=100, random_state=42)
+        self.model = HistGradientBoostingClassifier(
+            max_iter=200,
+            max_depth=8,
+            learning_rate=0.1,
+            early_stopping=True,
+            random_state=42,
+        )
         self.model.fit(X_train, y_train)
         
+        # Stored uncompressed: compressed joblib files cannot be memory-mapped
         joblib.dump((self.model, self.encoders), self.model_path)
 
     def load(self):
-        """Loads a pre-trained model from disk."""
+        """Loads a pre-trained model from disk.
+        
+        Arrays that survive unpickling as plain ndarrays, such as the gradient
+        boosting predictors' node tables, are memory-mapped read-only instead
+        of copied, so processes share the same pages. (Random forest trees
+        would not benefit: sklearn copies tree node arrays when unpickling.)
+        On Windows the mapping keeps ``model_path`` locked while the model is
+        loaded, so ``train()`` releases this instance's model before saving;
+        other references to the loaded model still hold the lock.
+        """
         if os.path.exists(self.model_path):
-            self.model, self.encoders = joblib.load(self.model_path)
+            self.model, self.encoders = joblib.load(self.model_path, mmap_mode="r")
         else:
             self.train()
 
     def predict(self, car_features: dict) -> str | None:
         """Predicts the price segment for a given set of car features."""
+        return self.predict_batch([car_features])[0]
+
+    def predict_batch(self, cars: List[dict]) -> List[str | None]:
+        """Predicts price segments for many cars with a single model call.
+        
+        Each car is judged on its own features only: a car with a missing
+        feature or a category the encoders have not seen maps to None. Boolean
+        features also accept strings such as 'True' or 'no'. If the
+        batched call fails, cars are retried one at a time so a single bad row
+        only costs its own prediction.
+        """
         if not self.model:
             self.load()
+        if not cars:
+            return []
+
+        df = pd.DataFrame(cars, columns=self.FEATURES)
+        known = pd.Series(True, index=df.index)
+        for col in self.FEATURES:
+            le = self.encoders.get(col)
+            if le is not None:
+                codes = {label: code for code, label in enumerate(le.classes_)}
+                if le.classes_.dtype == bool:
+                    df[col] = df[col].map(_parse_flag)
+                df[col] = df[col].map(lambda value: codes.get(value) if isinstance(value, Hashable) else None)
+            else:
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+            known &= df[col].notna()
+
+        predictions: List[str | None] = [None] * len(cars)
+        positions = np.flatnonzero(known.to_numpy())
+        if not len(positions):
+            return predictions
+        rows = df.iloc[positions].astype({col: int for col in self.encoders if col in self.FEATURES})
+        try:
+            results = self.model.predict(rows)
+        except Exception:
+            results = [self._predict_row(rows.iloc[[i]]) for i in range(len(rows))]
+        for position, prediction in zip(positions, results):
+            predictions[position] = prediction
+        return predictions
 
+    def _predict_row(self, row: pd.DataFrame) -> str | None:
         try:
-            df = pd.DataFrame([car_features])
-            for col, le in self.encoders.items():
-                if col in df.columns:
-                    # Handle unseen labels
-                    df[col] = df[col].apply(lambda x: x if x in le.classes_ else -1)
-                    df[col] = le.transform(df[col])
-
-            prediction = self.model.predict(df)
-            return prediction[0]
+            return self.model.predict(row)[0]
         except Exception:
             return None
 
@@ -16,16 +16,35 @@ class SessionLogger:
             mode: Either 'guessing' or 'recommendation'
         """
         self.mode = mode
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.started_at = datetime.now()
+        self.session_id = self.started_at.strftime("%Y%m%d_%H%M%S")
         self.interactions: List[Dict[str, Any]] = []
         self.log_dir = Path("logs") / mode if mode == "recommendation" else Path("logs")
         self.log_dir.mkdir(parents=True, exist_ok=True)
-        self.log_file = self.log_dir / f"{self._get_filename_prefix()}_{self.session_id}.json"
+        self.log_file = self._log_path(self.session_id)
+        self._header_written = False
+    
+    def _log_path(self, session_id: str) -> Path:
+        """Build the log file path for a session id."""
+        return self.log_dir / f"{self._get_filename_prefix()}_{session_id}.{self._get_extension()}"
     
     def _get_filename_prefix(self) -> str:
         """Get filename prefix based on mode."""
         return "recommendation" if self.mode == "recommendation" else "session"
     
+    @property
+    def _append_only(self) -> bool:
+        """Whether interactions are appended as JSON lines.
+        
+        Guessing sessions are append-only JSON lines; every other mode is
+        saved as a single JSON document.
+        """
+        return self.mode == "guessing"
+    
+    def _get_extension(self) -> str:
+        """Get file extension based on mode."""
+        return "jsonl" if self._append_only else "json"
+    
     def log_question(self, question: str, answer: str, value: Any):
         """Log a question-answer pair (guessing mode).
         
@@ -41,7 +60,7 @@ class SessionLogger:
             "value": str(value)
         }
         self.interactions.append(entry)
-        self._save()
+        self._record(entry)
     
     def log_result(self, result: str, guessed_car: str, actual_car: Optional[str] = None):
         """Log the final result (guessing mode).
@@ -60,7 +79,7 @@ class SessionLogger:
             entry["actual_car"] = actual_car
         
         self.interactions.append(entry)
-        self._save()
+        self._record(entry)
     
     def log_preferences(self, preferences: Dict[str, Any]):
         """Log user preferences (recommendation mode).
@@ -95,23 +114,73 @@ class SessionLogger:
         self.ai_processing = ai_info
         self._save()
     
-    def _save(self):
-        """Save current session to file."""
-        data = {
+    def _record(self, entry: Dict[str, Any]):
+        """Persist a new interaction.
+        
+        Guessing sessions append one line per interaction, so each write is
+        O(1) instead of re-serializing the whole session.
+        
+        Args:
+            entry: The interaction that was just added
+        """
+        if self._append_only:
+            self._append(entry)
+        else:
+            self._save()
+    
+    def _header(self) -> Dict[str, Any]:
+        """Build the session metadata shared by both log formats."""
+        return {
             "session_id": self.session_id,
             "mode": self.mode,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self.started_at.isoformat()
         }
+    
+    def _append(self, entry: Dict[str, Any]):
+        """Append an interaction to the JSON lines log.
+        
+        The first line of the file holds the session metadata.
+        
+        Args:
+            entry: The interaction to append
+        """
+        if not self._header_written:
+            self._create_log_file()
+        with open(self.log_file, 'a') as f:
+            f.write(json.dumps(entry) + "\n")
+    
+    def _create_log_file(self):
+        """Create the JSON lines log and write its metadata line.
+        
+        Session ids only have one-second resolution, so the file is created
+        exclusively; if another session in the same second already owns the
+        name, a numeric suffix is added to this session's id.
+        """
+        base_id = self.session_id
+        suffix = 0
+        while True:
+            try:
+                with open(self.log_file, 'x') as f:
+                    f.write(json.dumps(self._header()) + "\n")
+                break
+            except FileExistsError:
+                suffix += 1
+                self.session_id = f"{base_id}_{suffix}"
+                self.log_file = self._log_path(self.session_id)
+        self._header_written = True
+    
+    def _save(self):
+        """Save current recommendation session to file."""
+        if self._append_only:
+            return  # Interactions are appended as they happen
         
-        if self.mode == "guessing":
-            data["interactions"] = self.interactions
-        else:  # recommendation
-            if hasattr(self, 'preferences'):
-                data["preferences"] = self.preferences
-            if hasattr(self, 'recommendations'):
-                data["results"] = self.recommendations
-            if hasattr(self, 'ai_processing'):
-                data["ai_processing"] = self.ai_processing
+        data = self._header()
+        if hasattr(self, 'preferences'):
+            data["preferences"] = self.preferences
+        if hasattr(self, 'recommendations'):
+            data["results"] = self.recommendations
+        if hasattr(self, 'ai_processing'):
+            data["ai_processing"] = self.ai_processing
         
         with open(self.log_file, 'w') as f:
             json.dump(data, f, indent=2)
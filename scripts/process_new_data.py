@@ -2,6 +2,20 @@ import pandas as pd
 import re
 import os
 
+
+def _keyword_pattern(keywords):
+    """Compile keywords into one alternation that matches any of them as a substring."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Compiled once at import so each row is a single scan per category
+SUV_PATTERN = _keyword_pattern(["suv", "sport utility", "creta", "venue", "seltos", "compass", "harrier", "xuv", "thar", "brezza", "nexon"])
+SEDAN_PATTERN = _keyword_pattern(["sedan", "dzire", "city", "verna", "ciaz", "amaze", "aspire"])
+HATCHBACK_PATTERN = _keyword_pattern(["hatchback", "swift", "i10", "i20", "alto", "wagon", "baleno", "polo", "jazz", "glanza"])
+MUV_PATTERN = _keyword_pattern(["muv", "mpv", "innova", "ertiga", "marazzo", "xl6", "carens"])
+COMPACT_PATTERN = _keyword_pattern(["compact", "small", "mini"])
+LUXURY_BRAND_PATTERN = _keyword_pattern(["mercedes-benz", "mercedes", "bmw", "audi", "jaguar", "land rover", "volvo", "lexus", "porsche", "bentley", "rolls-royce"])
+
 def get_price_range(price):
     if pd.isna(price) or price < 1000000:
         return "under_10l"
@@ -23,13 +37,13 @@ def infer_body_type(model_name, seating_capacity):
     model_lower = str(model_name).lower()
     
     # Check for explicit mentions
-    if any(keyword in model_lower for keyword in ["suv", "sport utility", "creta", "venue", "seltos", "compass", "harrier", "xuv", "thar", "brezza", "nexon"]):
+    if SUV_PATTERN.search(model_lower):
         return "suv"
-    if any(keyword in model_lower for keyword in ["sedan", "dzire", "city", "verna", "ciaz", "amaze", "aspire"]):
+    if SEDAN_PATTERN.search(model_lower):
         return "sedan"
-    if any(keyword in model_lower for keyword in ["hatchback", "swift", "i10", "i20", "alto", "wagon", "baleno", "polo", "jazz", "glanza"]):
+    if HATCHBACK_PATTERN.search(model_lower):
         return "hatchback"
-    if any(keyword in model_lower for keyword in ["muv", "mpv", "innova", "ertiga", "marazzo", "xl6", "carens"]):
+    if MUV_PATTERN.search(model_lower):
         return "muv"
     
     # Use seating capacity as a hint
@@ -39,7 +53,7 @@ def infer_body_type(model_name, seating_capacity):
             return "muv"
         elif capacity == 5:
             # Default small 5-seaters to hatchback, larger ones to sedan
-            if any(keyword in model_lower for keyword in ["compact", "small", "mini"]):
+            if COMPACT_PATTERN.search(model_lower):
                 return "hatchback"
             return "sedan"
     
@@ -47,9 +61,8 @@ def infer_body_type(model_name, seating_capacity):
     return "hatchback"
 
 def infer_luxury(make, price):
-    luxury_brands = ["mercedes-benz", "mercedes", "bmw", "audi", "jaguar", "land rover", "volvo", "lexus", "porsche", "bentley", "rolls-royce"]
     make_lower = str(make).lower()
-    if any(brand in make_lower for brand in luxury_brands):
+    if LUXURY_BRAND_PATTERN.search(make_lower):
         return True
     if pd.notna(price) and price > 3000000:
         return True
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from automind.inference_engine import BeliefState, Evidence
+from automind.knowledge_base import KnowledgeBase
+
+DATA_FILE = Path(__file__).resolve().parent.parent / "data" / "car_data_enriched.csv"
+
+
+@pytest.fixture(scope="module")
+def kb():
+    return KnowledgeBase(str(DATA_FILE))
+
+
+@pytest.fixture(scope="module")
+def state(kb):
+    # A skewed, non-uniform distribution exercises every term of the formula
+    belief = BeliefState(kb.models, kb.model_index)
+    belief.apply_evidence(kb, Evidence("body_type", "suv", 0.8, 1.0))
+    belief.apply_evidence(kb, Evidence("fuel_type", "diesel", 0.6, 0.7))
+    return belief
+
+
+@pytest.mark.parametrize("attribute", ["body_type", "fuel_type", "brand", "luxury", "price_range"])
+@pytest.mark.parametrize("confidence, weight", [(0.8, 1.0), (0.8, 1.25), (0.3, 0.5), (0.0, 1.0)])
+def test_match_outcomes_agree_with_simulated_evidence(kb, state, attribute, confidence, weight):
+    values = kb.get_attribute_values(attribute) + ["no such value"]
+    matches = [kb.positions_matching(attribute, value) for value in values]
+
+    outcomes = state.match_outcomes(matches, confidence, weight)
+
+    for value, positions, (probability, entropy, gini) in zip(values, matches, outcomes):
+        simulated = state.simulate_evidence(kb, Evidence(attribute, value, confidence, weight))
+        expected_probability = state.probability_of_models(kb.get_models_matching(attribute, value))
+        if confidence <= 0 or not positions.size:
+            expected_probability = 0.0
+        assert probability == pytest.approx(expected_probability, abs=1e-14)
+        assert entropy == pytest.approx(simulated.entropy(), abs=1e-12)
+        assert gini == pytest.approx(simulated.gini_impurity(), abs=1e-14)
+
+
+def test_match_outcomes_on_uniform_state(kb):
+    belief = BeliefState(kb.models, kb.model_index)
+    positions = kb.positions_matching("body_type", "sedan")
+
+    (probability, entropy, gini), = belief.match_outcomes([positions], 0.8)
+
+    simulated = belief.simulate_evidence(kb, Evidence("body_type", "sedan", 0.8))
+    assert probability == pytest.approx(len(positions) / len(kb.models))
+    assert entropy == pytest.approx(simulated.entropy(), abs=1e-12)
+    assert gini == pytest.approx(simulated.gini_impurity(), abs=1e-14)
+    assert entropy < np.log2(len(kb.models))
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from automind.utils.logger import SessionLogger
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def read_lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_guessing_session_round_trips_as_json_lines():
+    logger = SessionLogger(mode="guessing")
+    logger.log_question("Preferred fuel or powertrain?", "Electric", "electric")
+    logger.log_question("Body style?", "SUV", "suv")
+    logger.log_result("correct", "Nexon EV")
+
+    assert logger.get_log_path().endswith(".jsonl")
+    header, *entries = read_lines(logger.get_log_path())
+    assert header["session_id"] == logger.session_id
+    assert header["mode"] == "guessing"
+    assert entries == logger.get_interactions()
+    assert all(header["timestamp"] <= entry["timestamp"] for entry in entries)
+
+
+def test_sessions_started_in_the_same_second_get_separate_files():
+    first = SessionLogger(mode="guessing")
+    second = SessionLogger(mode="guessing")
+    # Simulate both sessions starting within the same second
+    second.session_id, second.log_file = first.session_id, first.log_file
+
+    first.log_question("Q1", "A", "a")
+    second.log_question("Q1", "B", "b")
+    first.log_result("correct", "Car A")
+    second.log_result("incorrect", "Car B")
+
+    assert first.get_log_path() != second.get_log_path()
+    for logger in (first, second):
+        header, *entries = read_lines(logger.get_log_path())
+        assert header["session_id"] == logger.session_id
+        assert entries == logger.get_interactions()
+
+
+def test_recommendation_session_is_a_single_json_document():
+    logger = SessionLogger(mode="recommendation")
+    logger.log_preferences({"brand": "Tata"})
+
+    assert logger.get_log_path().endswith(".json")
+    with open(logger.get_log_path()) as f:
+        data = json.load(f)
+    assert data["mode"] == "recommendation"
+    assert data["preferences"] == {"brand": "Tata"}
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+
+from automind.ml_model import CarPriceClassifier
+
+DATA_FILE = Path(__file__).resolve().parent.parent / "data" / "car_data_enriched.csv"
+
+WELL_FORMED = {"body_type": "suv", "fuel_type": "diesel", "luxury": False, "engine_cc": 2200}
+
+
+@pytest.fixture(scope="module")
+def classifier(tmp_path_factory):
+    model_path = tmp_path_factory.mktemp("model") / "ml_model.joblib"
+    trained = CarPriceClassifier(data_path=str(DATA_FILE), model_path=str(model_path))
+    trained.train()
+    trained.load()
+    return trained
+
+
+def test_predict_batch_matches_single_predictions(classifier):
+    cars = [
+        {"body_type": "suv", "fuel_type": "diesel", "luxury": False},  # no engine_cc
+        WELL_FORMED,
+        {"engine_cc": 1200, "luxury": False, "fuel_type": "petrol", "body_type": "hatchback"},
+        {"body_type": "spaceship", "fuel_type": "petrol", "luxury": False, "engine_cc": 1200},
+        {"body_type": "sedan", "fuel_type": "petrol", "luxury": "True", "engine_cc": 2000},
+    ]
+
+    batched = classifier.predict_batch(cars)
+
+    assert batched == [classifier.predict(car) for car in cars]
+    assert batched[0] is None
+    assert batched[1] is not None
+    assert batched[2] is not None
+    assert batched[3] is None
+
+
+def test_bool_like_strings_read_as_booleans(classifier):
+    for text, flag in (("True", True), ("yes", True), ("False", False), ("no", False)):
+        assert classifier.predict(dict(WELL_FORMED, luxury=text)) == classifier.predict(dict(WELL_FORMED, luxury=flag))
+    assert classifier.predict(dict(WELL_FORMED, luxury="maybe")) is None
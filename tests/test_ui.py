@@ -1,10 +1,25 @@
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-import time
+import requests
+
+def test_automind_health():
+    # Fast smoke check over plain HTTP, no browser needed. Streamlit's initial
+    # HTML is a generic shell, so check its health endpoint and the index page
+    # rather than looking for the app title.
+    health = requests.get("http://localhost/_stcore/health", timeout=5)
+    assert health.status_code == 200
+    assert health.text.strip() == "ok"
+
+    index = requests.get("http://localhost", timeout=5)
+    assert index.status_code == 200
 
 def test_automind_load():
+    # Imported here so collecting this module does not load selenium
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     # Setup Chrome options for the VM environment (Headless is mandatory for Jenkins)
     chrome_options = Options()
     chrome_options.add_argument("--headless")  
@@ -18,8 +33,10 @@ def test_automind_load():
         # 1. Navigate to your local AutoMind app [cite: 211]
         driver.get("http://localhost")
         
-        # 2. Wait for Streamlit's frontend to render [cite: 221]
-        time.sleep(5) 
+        # 2. Wait for Streamlit's frontend to render the title [cite: 221]
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'AutoMind')]"))
+        )
 
         # 3. Assertion: Verify the app title exists in the page source [cite: 225, 226]
         assert "AutoMind" in driver.page_source